@@ -0,0 +1,63 @@
+"""Compares parse time and model memory of the default and minimal pipelines.
+
+run) python benchmarks/minimal_pipeline.py --langs en ko --sizes sm md lg
+"""
+import argparse
+import time
+
+from spacy_space import SplitEngine
+from spacy_space.pool import estimate_memory_mb
+
+
+SAMPLE_TEXT = (
+    "The quick brown fox, which had been watching the farm for days, finally jumped over the lazy dog "
+    "and ran into the forest before the farmer could even notice what had happened. "
+)
+
+
+def benchmark(lang_code, size_code, text, repeat):
+    """Loads both pipelines of a model and measures them.
+
+    RETURNS (List[Tuple]): (mode, pipe_names, memory_mb, seconds_per_document) of each pipeline.
+    """
+    results = list()
+    for minimal in (False, True):
+        engine = SplitEngine(lang_code, size_code, minimal=minimal)
+        engine.load_document(text)  # warmup
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            engine.load_document(text)
+        elapsed = (time.perf_counter() - start) / repeat
+
+        results.append((
+            "minimal" if minimal else "default",
+            engine.nlp_engine.pipe_names,
+            estimate_memory_mb(engine),
+            elapsed,
+        ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--langs", nargs="+", default=["en"])
+    parser.add_argument("--sizes", nargs="+", default=None, help="size codes, every available size if not given")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--text-repeat", type=int, default=20, help="number of sample sentences per document")
+    args = parser.parse_args()
+
+    text = SAMPLE_TEXT * args.text_repeat
+    print("lang\tsize\tmode\tmemory_mb\tms_per_doc\tspeedup\tpipeline")
+    for lang_code in args.langs:
+        size_codes = args.sizes or SplitEngine.get_available_size_codes(lang_code)
+        for size_code in size_codes:
+            (_, default_pipes, default_mb, default_sec), (_, minimal_pipes, minimal_mb, minimal_sec) = \
+                benchmark(lang_code, size_code, text, args.repeat)
+            print(f"{lang_code}\t{size_code}\tdefault\t{default_mb:.1f}\t{default_sec * 1000:.2f}\t1.00\t{default_pipes}")
+            print(f"{lang_code}\t{size_code}\tminimal\t{minimal_mb:.1f}\t{minimal_sec * 1000:.2f}\t"
+                  f"{default_sec / minimal_sec:.2f}\t{minimal_pipes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,2 @@
-from .engine import SplitEngine
\ No newline at end of file
+from .engine import SplitEngine
+from .pool import SplitEnginePool
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Packing of chunks into batches for downstream models (e.g. TTS acoustic models)."""
+from bisect import bisect_left, insort
+from typing import Iterable, Sequence
+
+import numpy as np
+
+
+def plan_batches(
+    lengths: Iterable[Sequence[int]],
+    max_items: int = None,
+    max_total_length: int = None,
+    padded: bool = True,
+):
+    """Packs chunks of many documents into batches under item and length limits.
+
+    Chunks are sorted by length in decreasing order, so that chunks of similar lengths share a batch.
+    If `padded`, a batch costs its longest length times its number of items, as padded
+    inputs of a batch do, and consecutive chunks are packed until the limits are reached.
+    Otherwise, a batch costs the sum of its lengths, and each chunk goes to the fullest
+    batch it still fits in (best-fit decreasing).
+    A chunk longer than `max_total_length` is given a batch of its own.
+
+    lengths (Iterable[Sequence[int]]): Length (or any cost) of each chunk, per document.
+        e.g. `[ [ len(c) for c in engine.to_chunks_by_len(40) ] for _ in engine.load_documents(texts) ]`
+    max_items (int): Maximum number of chunks in a batch. If None, unbounded.
+    max_total_length (int): Maximum total length of a batch. If None, unbounded.
+    padded (bool): Whether a batch costs its longest length times its size, or the sum of its lengths.
+
+    RETURNS (Tuple[List[np.ndarray], np.ndarray, np.ndarray]): Flat chunk indices of each batch,
+        and the document index and chunk index (in the document) of each flat chunk index.
+    """
+    assert max_items is None or max_items > 0, "Valid `max_items` param must be given."
+    assert max_total_length is None or max_total_length > 0, "Valid `max_total_length` param must be given."
+
+    flat_lengths = list()
+    doc_indices = list()
+    chunk_indices = list()
+    for doc_index, this_doc_lengths in enumerate(lengths):
+        for chunk_index, length in enumerate(this_doc_lengths):
+            flat_lengths.append(length)
+            doc_indices.append(doc_index)
+            chunk_indices.append(chunk_index)
+    flat_lengths = np.array(flat_lengths, dtype=np.int64)
+    doc_indices = np.array(doc_indices, dtype=np.int64)
+    chunk_indices = np.array(chunk_indices, dtype=np.int64)
+
+    order = np.argsort(-flat_lengths, kind="stable")
+    if padded:
+        batches = _pack_padded(flat_lengths, order, max_items, max_total_length)
+    else:
+        batches = _pack_best_fit(flat_lengths, order, max_items, max_total_length)
+
+    return [ np.array(batch, dtype=np.int64) for batch in batches ], doc_indices, chunk_indices
+
+
+def _pack_padded(lengths, order, max_items, max_total_length):
+    """Packs consecutive chunks in decreasing length order, where the first chunk of a batch is its longest.
+
+    RETURNS (List[List[int]]): Flat chunk indices of each batch.
+    """
+    batches = list()
+    batch = list()
+    for i in order:
+        if batch and (
+            (max_items is not None and len(batch) + 1 > max_items)
+            or (max_total_length is not None and lengths[batch[0]] * (len(batch) + 1) > max_total_length)
+        ):
+            batches.append(batch)
+            batch = list()
+        batch.append(int(i))
+    if batch: batches.append(batch)
+    return batches
+
+
+def _pack_best_fit(lengths, order, max_items, max_total_length):
+    """Packs chunks in decreasing length order into the open batch with the least room that fits them.
+
+    RETURNS (List[List[int]]): Flat chunk indices of each batch.
+    """
+    batches = list()
+    open_batches = list()  # (remaining length, batch index), sorted; batches with room for more items
+    for i in order:
+        length = int(lengths[i])
+        position = bisect_left(open_batches, (length, -1))
+        if max_total_length is not None and position < len(open_batches):
+            remaining, b = open_batches.pop(position)
+        else:
+            if max_total_length is None and open_batches:
+                remaining, b = open_batches.pop()
+            else:
+                remaining, b = (max_total_length if max_total_length is not None else 0), len(batches)
+                batches.append(list())
+
+        batches[b].append(int(i))
+        if max_total_length is not None:
+            remaining -= length
+            if remaining < 0: continue  # a chunk longer than `max_total_length`, alone in its batch
+        if max_items is None or len(batches[b]) < max_items:
+            insort(open_batches, (remaining, b))
+    return batches
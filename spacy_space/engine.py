@@ -1,9 +1,17 @@
+from bisect import bisect_left
+from collections import deque
 from copy import deepcopy
+import gc
+from itertools import chain
 import numpy as np
 import sys
-from typing import Any, Dict, Union
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, Union
 
 import spacy
+from spacy.pipeline import Sentencizer
+from spacy.tokens import Doc, Span
 from spacy.tokens.token import Token
 from spacy.util import SimpleFrozenDict
 from spacy.vocab import Vocab
@@ -21,6 +29,11 @@ class SplitEngine:
         resource_size_code: str,
         vocab: Union[Vocab, bool] = True,
         config: Union[Dict[str, Any], Config] = SimpleFrozenDict(),
+        minimal: bool = False,
+        max_sentence_tokens: int = None,
+        window_overlap: int = None,
+        vocab_reset_interval: int = None,
+        max_vocab_strings: int = None,
     ):
         """Loads a spaCy model for sentence intra-splitting.
 
@@ -32,14 +45,32 @@ class SplitEngine:
             A Vocab object. If True, a vocab is created.
         config (Dict[str, Any] / Config): `config` parameter for `spacy.load()` function.
             Config overrides as nested dict or dict keyed by section values in dot notation.
+        minimal (bool): If True, remove every pipeline component the splitting does not need,
+            keeping only the "parser" and the components it listens to (e.g. "tok2vec", "transformer").
+        max_sentence_tokens (int): If given, spans between sentence-final punctuations longer than
+            this number of tokens (e.g. unpunctuated transcripts) are parsed in overlapping windows,
+            bounding the parsing time and memory of a single sentence.
+        window_overlap (int): Number of tokens shared by adjacent windows, as context for parsing.
+            Defaults to a quarter of `max_sentence_tokens`.
+        vocab_reset_interval (int): If given, the vocab is restored to its original state
+            after loading this number of documents. Refer to `SplitEngine.reset_vocab()`.
+        max_vocab_strings (int): If given, the vocab is restored to its original state
+            when its `StringStore` holds more strings than this number, in total.
+            It must be larger than the number of strings of the loaded model,
+            `get_vocab_stats()["num_original_strings"]`, which a reset goes back to.
+            Both limits are checked between documents, where the strings of the documents
+            read ahead by `load_documents()` are counted too.
         """
-        # normalize language code
-        resource_lang_code = resource_lang_code.lower()
-        if resource_lang_code in _LANG_ALIASES: resource_lang_code = _LANG_ALIASES[resource_lang_code]
+        assert max_sentence_tokens is None or max_sentence_tokens > 1, \
+            "Valid `max_sentence_tokens` param must be given."
+        assert vocab_reset_interval is None or vocab_reset_interval > 0, \
+            "Valid `vocab_reset_interval` param must be given."
+        if max_sentence_tokens is not None and window_overlap is None: window_overlap = max_sentence_tokens // 4
+        assert max_sentence_tokens is None or 0 <= window_overlap < max_sentence_tokens, \
+            "`window_overlap` param must be smaller than `max_sentence_tokens` param."
 
-        # normalize size code
-        resource_size_code = resource_size_code.lower()
-        if resource_size_code in _SIZE_ALIASES: resource_size_code = _SIZE_ALIASES[resource_size_code]
+        # normalize language code and size code
+        resource_lang_code, resource_size_code = self.normalize_codes(resource_lang_code, resource_size_code)
 
         # get spaCy model code
         resource_name = self.get_resource_name(resource_lang_code, resource_size_code)
@@ -68,105 +99,621 @@ class SplitEngine:
                 config=config,
             )
 
+        if minimal: self.__prune_pipeline()
+
+        self.resource_name = resource_name
+        self.max_sentence_tokens = max_sentence_tokens
+        self.window_overlap = window_overlap
+        self.vocab_reset_interval = vocab_reset_interval
+        self.max_vocab_strings = max_vocab_strings
+
+        # original state of the vocab, to restore from
+        self.__original_strings = self.nlp_engine.vocab.strings.to_bytes()
+        self.__num_original_strings = len(self.nlp_engine.vocab.strings)
+        # otherwise the vocab would be restored after every document
+        assert max_vocab_strings is None or max_vocab_strings > self.__num_original_strings, \
+            f"`max_vocab_strings` param must be larger than the {self.__num_original_strings} strings of '{resource_name}'."
+        self.__num_documents_since_reset = 0
+        self.__num_vocab_resets = 0
+
         self.__document = ""
 
-    
-    def load_document(self, text:str):
+    def __prune_pipeline(self):
+        """Removes pipeline components which neither are the parser nor feed the parser.
+
+        Special characters are checked via lexical attributes only, so no tagger output is needed.
+        """
+        nlp = self.nlp_engine
+        if "parser" not in nlp.component_names: return  # nothing to split sentences with, keep as is
+
+        required = {"parser"}
+        for name, proc in nlp.components:
+            # shared embedding layers, e.g. "tok2vec" or "transformer" with listeners
+            if "parser" in getattr(proc, "listening_components", []):
+                required.add(name)
+
+        for name in nlp.component_names:
+            if name not in required:
+                nlp.remove_pipe(name)
+
+
+    def __getstate__(self):
+        """Serializes the engine with spaCy's byte serialization, instead of pickling the pipeline.
+        """
+        state = self.__dict__.copy()
+        nlp = state.pop("nlp_engine")
+        state["nlp_engine_config"] = nlp.config.to_str()
+        state["nlp_engine_bytes"] = nlp.to_bytes()
+        return state
+
+    def __setstate__(self, state):
+        """Restores the engine serialized by `__getstate__()`.
+        """
+        config = Config().from_str(state.pop("nlp_engine_config"))
+        nlp_bytes = state.pop("nlp_engine_bytes")
+        lang_cls = spacy.util.get_lang_class(config["nlp"]["lang"])
+        self.nlp_engine = lang_cls.from_config(config).from_bytes(nlp_bytes)
+        self.__dict__.update(state)
+
+    def preload(self, warmup_text:str="This is a warmup sentence."):
+        """Warms up the pipeline and freezes it before forking worker processes.
+
+        Call this in the parent process (e.g. in a gunicorn app with `preload_app = True`,
+        or before starting `multiprocessing` workers with the "fork" start method).
+        Running a document once allocates lazily built pipeline state in the parent,
+        and `gc.freeze()` moves every object into the permanent generation, so that
+        garbage collections in the workers do not touch them and the memory pages
+        stay shared copy-on-write.
+
+        warmup_text (str): text to run through the pipeline once.
+        """
+        self.nlp_engine(preprocess(warmup_text))
+        gc.collect()
+        gc.freeze()
+
+    def reset_vocab(self):
+        """Restores the vocab to its original state, dropping every string and lexeme
+        interned by the documents loaded so far, without reloading the model from disk.
+
+        The pipeline is rebuilt from its config and in-memory weights on a new vocab,
+        with a copy of the vectors table and sharing the lookups tables of the current one.
+        If a `vocab` was given on initialization, the engine no longer shares it afterwards.
+        """
+        nlp = self.nlp_engine
+        lang_cls = spacy.util.get_lang_class(nlp.config["nlp"]["lang"])
+        new_nlp = lang_cls.from_config(nlp.config)
+        new_nlp.vocab.strings.from_bytes(self.__original_strings)
+
+        # vectors are bound to the strings of a vocab, and may be shared with other pipelines
+        new_nlp.vocab.vectors.from_bytes(nlp.vocab.vectors.to_bytes(exclude=["strings"]), exclude=["strings"])
+        new_nlp.vocab.lookups = nlp.vocab.lookups
+
+        self.nlp_engine = new_nlp.from_bytes(nlp.to_bytes(exclude=["vocab"]), exclude=["vocab"])
+        self.__num_documents_since_reset = 0
+        self.__num_vocab_resets += 1
+
+    def get_vocab_stats(self):
+        """Reports the size of the vocab, to monitor its growth.
+
+        RETURNS (Dict[str, Any]): Vocab statistics.
+        """
+        strings = self.nlp_engine.vocab.strings
+        return {
+            "num_strings": len(strings),
+            "num_original_strings": self.__num_original_strings,
+            "num_lexemes": len(self.nlp_engine.vocab),
+            # UTF-8 payload of the strings only, excluding per-object overheads
+            "strings_mb": sum(len(string.encode("utf-8")) for string in strings) / (1024 * 1024),
+            "num_documents_since_reset": self.__num_documents_since_reset,
+            "num_vocab_resets": self.__num_vocab_resets,
+        }
+
+    def __check_vocab_growth(self):
+        """Restores the vocab if it grew over the limits given on initialization.
+
+        Called only before parsing starts, never while `nlp.pipe()` runs on the current pipeline.
+        """
+        if self.__is_vocab_over_limits(): self.reset_vocab()
+
+    def __is_vocab_over_limits(self):
+        """Checks whether the vocab grew over the limits given on initialization.
+
+        RETURNS (bool): True if over the limits, False otherwise.
+        """
+        return (
+            (self.vocab_reset_interval is not None
+             and self.__num_documents_since_reset >= self.vocab_reset_interval)
+            or (self.max_vocab_strings is not None
+                and len(self.nlp_engine.vocab.strings) > self.max_vocab_strings)
+        )
+
+    def load_document(self, text:str, time_budget:float=None):
         """Loads a non-splitted string of single document and reformat.
 
         text (str): non-splitted string of a single document.
+        time_budget (float): Time budget for parsing in seconds. If given, the document is parsed
+            sentence by sentence, and the sentences left when the budget runs out are not parsed
+            but split by punctuations and lengths only.
+            Refer to `SplitEngine.get_degraded_sentence_indices()` for those sentences.
+        """
+        if time_budget is None:
+            for _ in self.load_documents([text]): pass
+        else:
+            self.__check_vocab_growth()
+            self.__num_documents_since_reset += 1
+            self.__load_document_until(preprocess(text), time.perf_counter() + time_budget)
+
+    def update_document(self, text:str):
+        """Loads an edited version of the loaded document, reparsing only the changed sentences.
+
+        The common prefix and suffix with the loaded document are found, and the sentences
+        lying entirely inside them are reused as they are. The text in-between is parsed again,
+        along with the sentences next to it, as long as the edit moves their boundaries.
+
+        text (str): non-splitted string of the edited document.
+        """
+        document = preprocess(text)
+        previous = self.__document
+        if not previous:
+            self.load_document(document)
+            return
+        if document == previous: return
+
+        self.__check_vocab_growth()
+        self.__num_documents_since_reset += 1
+
+        # lengths of the unchanged prefix and suffix in characters
+        max_common = min(len(previous), len(document))
+        prefix = 0
+        while prefix < max_common and previous[prefix] == document[prefix]: prefix += 1
+        suffix = 0
+        while suffix < max_common - prefix and previous[-suffix-1] == document[-suffix-1]: suffix += 1
+
+        starts = self.__get_sentence_starts()
+        num_sentences = len(starts)
+
+        # unchanged sentences, which end before the prefix ends or start after the suffix starts
+        head = 0
+        while head < num_sentences and self.__parsed[head] \
+            and starts[head] + len(self.__sentences[head]) < prefix:
+            head += 1
+        tail = 0
+        while tail < num_sentences - head and self.__parsed[-tail-1] \
+            and starts[-tail-1] > len(previous) - suffix:
+            tail += 1
+
+        # an edit may move the sentence boundaries next to it, so the sentences adjacent to
+        # the edit are parsed again too, and more of them while they come out differently
+        previous_data = self.__get_sentence_data()
+        previous_sentences = self.__sentences
+        margin = 1
+        while True:
+            this_head, this_tail = max(head - margin, 0), max(tail - margin, 0)
+
+            middle_start = starts[this_head-1] + len(previous_sentences[this_head-1]) if this_head > 0 else 0
+            middle_end = starts[-this_tail] + len(document) - len(previous) if this_tail > 0 else len(document)
+            middle = document[middle_start:middle_end].strip()
+
+            self.__reset_document(document)
+            for l, h in zip(self.__get_sentence_data(), previous_data): l.extend(h[:this_head])
+            if middle: self.__append_text(middle)
+            num_middle = len(self.__sentences) - this_head
+            for l, t in zip(self.__get_sentence_data(), previous_data): l.extend(t[num_sentences-this_tail:])
+
+            # the boundaries hold if the first and last sentences parsed again are the same as before
+            head_matched = this_head == 0 or (
+                num_middle > 0 and self.__sentences[this_head] == previous_sentences[this_head]
+            )
+            tail_matched = this_tail == 0 or (
+                num_middle > 0 and self.__sentences[-this_tail-1] == previous_sentences[-this_tail-1]
+            )
+            if head_matched and tail_matched: break
+            margin += 1
+
+    def load_documents(self, texts:Iterable[str], batch_size:int=None):
+        """Loads non-splitted strings of many documents in turn, parsing them in batches.
+
+        Each document stays loaded from when it is yielded until the next one is requested,
+        so `to_sentences()` and `to_chunks*()` can be called inside the loop.
+        `texts` is read lazily, a batch ahead of the document being yielded.
+
+        texts (Iterable[str]): non-splitted strings of documents.
+        batch_size (int): `batch_size` parameter for `nlp.pipe()` function.
+
+        YIELDS (str): preprocessed string of the document currently loaded.
         """
-        self.__document = preprocess(text)
-        doc = self.nlp_engine(self.__document)
+        inputs = self.__get_pipe_inputs(texts)
+        while True:
+            self.__check_vocab_growth()
+
+            in_flight = deque()  # inputs read ahead by `nlp.pipe()`, not loaded yet
+            docs = self.nlp_engine.pipe(self.__track_inputs(inputs, in_flight), as_tuples=True, batch_size=batch_size)
+            for doc, (document, window, window_index, num_windows) in docs:
+                in_flight.popleft()
+                if window_index == 0:
+                    self.__num_documents_since_reset += 1
+                    self.__reset_document(document)
+
+                if window is None:
+                    for sent in doc.sents:
+                        self.__append_sentence(sent)
+                else:
+                    self.__append_window(doc, *window)
+
+                if window_index + 1 == num_windows:
+                    yield document
+                    # the vocab is restored between documents only, and the inputs
+                    # read ahead are parsed again with the new pipeline
+                    if self.__is_vocab_over_limits(): break
+            else:
+                return
+            inputs = chain(list(in_flight), inputs)
+
+    def __track_inputs(self, inputs:Iterable[tuple], in_flight:deque):
+        """Passes inputs through, keeping those not consumed yet.
+
+        inputs (Iterable[tuple]): (text, context) pairs for `nlp.pipe()`.
+        in_flight (deque): Where the passed inputs are appended to.
+
+        YIELDS (tuple): (text, context) pair.
+        """
+        for item in inputs:
+            in_flight.append(item)
+            yield item
+
+    def __get_pipe_inputs(self, texts:Iterable[str]):
+        """Lazily turns documents into the texts to parse, each with where it belongs.
+
+        texts (Iterable[str]): non-splitted strings of documents.
+
+        YIELDS (Tuple[str, tuple]): A document or one of its windows, and (preprocessed document,
+            character offsets of the window or None, window index, number of windows of the document).
+        """
+        for text in texts:
+            document = preprocess(text)
+            windows = self.__get_windows(document)
+            if windows is None:
+                yield document, (document, None, 0, 1)
+            else:
+                for i, (window_text, window) in enumerate(windows):
+                    yield window_text, (document, window, i, len(windows))
+
+    def __load_document_until(self, document:str, deadline:float):
+        """Parses a document sentence by sentence until the deadline, and stores it as the loaded document.
+
+        Sentences are pre-segmented by the tokenizer and the punctuation characters of
+        spaCy's rule-based `Sentencizer`, since the parser cannot be interrupted midway.
+
+        document (str): preprocessed string of a single document.
+        deadline (float): `time.perf_counter()` value after which sentences are no longer parsed.
+        """
+        self.__reset_document(document)
+
+        for piece in self.__get_pieces(self.nlp_engine.make_doc(document)):
+            for window, core in self.__get_piece_windows(piece):
+                if time.perf_counter() < deadline:
+                    self.__append_window(
+                        self.nlp_engine(window.text), window.start_char, core.start_char, core.end_char
+                    )
+                else:
+                    self.__append_sentence(core, parsed=False)
+
+    def __append_text(self, document:str):
+        """Parses a text and appends its sentences to the loaded document.
+
+        document (str): preprocessed string of a part of a document.
+        """
+        windows = self.__get_windows(document)
+        if windows is None:
+            for sent in self.nlp_engine(document).sents:
+                self.__append_sentence(sent)
+        else:
+            for window_text, window in windows:
+                self.__append_window(self.nlp_engine(window_text), *window)
+
+    def __get_sentence_starts(self):
+        """Gets the character offset of each sentence in the loaded document.
+
+        RETURNS (List[int]): Offset of each sentence.
+        """
+        starts = list()
+        position = 0
+        for sentence in self.__sentences:
+            position = self.__document.find(sentence, position)
+            starts.append(position)
+            position += len(sentence)
+        return starts
+
+    def __get_sentence_data(self):
+        """Gets every per-sentence list of the loaded document.
+
+        RETURNS (List[list]): ① to ⑦ lists, in order.
+        """
+        return [
+            self.__sentences, self.__token_values, self.__edges,
+            self.__valid_token_indices, self.__subtree_indices, self.__parsed,
+            self.__token_offsets,
+        ]
+
+    def __get_pieces(self, tokens:Doc):
+        """Pre-segments a tokenized document at the punctuation characters of spaCy's rule-based `Sentencizer`.
+
+        tokens (Doc): A document tokenized by spaCy, not parsed.
+
+        RETURNS (List[Span]): Spans ending with sentence-final punctuations, and the remainder.
+        """
+        pieces = list()
+        start = 0
+        for i, token in enumerate(tokens):
+            is_last = i + 1 == len(tokens)
+            if is_last or (
+                token.text in Sentencizer.default_punct_chars
+                and tokens[i+1].text not in Sentencizer.default_punct_chars
+            ):
+                pieces.append(tokens[start:i+1])
+                start = i + 1
+        return pieces
+
+    def __get_piece_windows(self, piece:Span):
+        """Splits a span into overlapping windows, if it is longer than `max_sentence_tokens`.
+
+        Windows are made of non-overlapping cores, each extended by half of `window_overlap`
+        tokens to the left and the rest to the right, so that cores are parsed with context.
+
+        piece (Span): A span of a tokenized document.
+
+        RETURNS (List[Tuple[Span, Span]]): (window, core) pairs, cores covering the whole span.
+        """
+        if self.max_sentence_tokens is None or len(piece) <= self.max_sentence_tokens:
+            return [(piece, piece)]
+
+        tokens = piece.doc
+        stride = self.max_sentence_tokens - self.window_overlap
+        windows = list()
+        for core_start in range(piece.start, piece.end, stride):
+            core_end = min(core_start + stride, piece.end)
+            window_start = max(piece.start, core_start - self.window_overlap // 2)
+            window_end = min(piece.end, window_start + self.max_sentence_tokens)
+            windows.append((tokens[window_start:window_end], tokens[core_start:core_end]))
+        return windows
+
+    def __get_windows(self, document:str):
+        """Gets the windows to parse a document with, if it has a span longer than `max_sentence_tokens`.
+
+        document (str): preprocessed string of a single document.
+
+        RETURNS (List[Tuple[str, Tuple[int, int, int]]]): Text of each window over the document,
+            and the character offsets of its start, its core start and its core end,
+            or None if the document can be parsed as a whole.
+        """
+        if self.max_sentence_tokens is None: return None
+
+        pieces = self.__get_pieces(self.nlp_engine.make_doc(document))
+        if all(len(piece) <= self.max_sentence_tokens for piece in pieces): return None
+
+        # offsets instead of spans, so that the tokenized document is not kept alive
+        return [
+            (window.text, (window.start_char, core.start_char, core.end_char))
+            for piece in pieces for window, core in self.__get_piece_windows(piece)
+        ]
+
+    def __append_window(self, doc:Doc, window_start_char:int, core_start_char:int, core_end_char:int):
+        """Appends the sentences of a parsed window, clipped to its core.
+
+        doc (Doc): A window of a document parsed by spaCy.
+        window_start_char (int): Character offset of the window in the document.
+        core_start_char (int): Character offset of the start of the part to append, in the document.
+        core_end_char (int): Character offset of the end of the part to append, in the document.
+        """
+        # tokens belong to the core they start in, so that adjacent cores never share a token
+        token_starts = [ token.idx for token in doc ]
+        core_start = bisect_left(token_starts, core_start_char - window_start_char)
+        core_end = bisect_left(token_starts, core_end_char - window_start_char)
+
+        for sent in doc.sents:
+            start, end = max(sent.start, core_start), min(sent.end, core_end)
+            if start < end:
+                self.__append_sentence(doc[start:end])
+
+    def __reset_document(self, document:str):
+        """Clears the loaded document and sets a new one.
+
+        document (str): preprocessed string of a single document.
+        """
+        self.__document = document
 
         self.__sentences = list() # ①
         self.__token_values = list() # ②
         self.__edges = list() # ③
         self.__valid_token_indices = list() # ④
         self.__subtree_indices = list() # ⑤
+        self.__parsed = list() # ⑥
+        self.__token_offsets = list() # ⑦ character offsets of ② inside each sentence
 
-        for sent in doc.sents:
-            # add raw sentence string into ①
-            self.__sentences.append(str(sent))
+        # indices of sentences chunked without dependency edges in the last `to_chunks*()` call
+        self.__degraded_indices = list()
+        # (sentence index, first token index, last token index) of each chunk in the last `to_chunks*()` call
+        self.__chunk_spans = list()
 
-            # temporary list objects for ② `self.__token_values`
-            this_sent_token_values_m = [ None for _ in range(len(sent))]
-            this_sent_token_values_l = [ None for _ in range(len(sent))]
-            this_sent_token_values_r = [ None for _ in range(len(sent))]
 
-            # temporary list object for ③ `self.__edges`
-            this_sent_edges = list()
+    def __append_sentence(self, sent:Span, parsed:bool=True):
+        """Reformats a single sentence and appends it to the loaded document.
 
-            # temporary list object for ④ `self.__valid_token_indices`
-            this_sent_valid_token_indices = np.array([ True for _ in range(len(sent)) ])
+        sent (Span): A sentence from a spaCy document.
+        parsed (bool): Whether the sentence has a dependency parse.
+            If False, special characters are attached by punctuation and spacing rules only,
+            and the sentence is chunked without dependency edges.
+        """
+        # add raw sentence string into ①
+        self.__sentences.append(str(sent))
 
-            # temporary list object for ⑤ `self.__subtree_indices`
-            this_sent_subtree_indices = [ None for _ in range(len(sent))]
+        # temporary list objects for ② `self.__token_values`
+        this_sent_token_values_m = [ None for _ in range(len(sent))]
+        this_sent_token_values_l = [ None for _ in range(len(sent))]
+        this_sent_token_values_r = [ None for _ in range(len(sent))]
 
-            # enumerate through tokens inside a single sentence
-            for i, token in enumerate(sent):
-                # save token index of whole document
-                if i == 0: token_index_offset = token.i
-                
-                # save ② raw token objects to post-process
-                ## if token is a special character
-                if self.__is_special_token(token):
-                    # first ancestor from the `ancestors` generator is direct parent
-                    for a in token.ancestors: parent_token = a; break
-
-                    if token.i - parent_token.i < 0:
-                        # parent at right
-                        this_sent_token_values_l[i+1] = token
-                        this_sent_valid_token_indices[i] = False # ④
-                    else:
-                        # parent at left
-                        this_sent_token_values_r[i-1] = token
-                        this_sent_valid_token_indices[i] = False # ④
-                ## if token is not a special character
-                else:
-                    this_sent_token_values_m[i] = token
-
-                # save ③ dependency edge infos
-                for child in token.children:
-                    # only if connected child is not a special character.
-                    if not self.__is_special_token(child):
-                        this_sent_edges.append(
-                            DependencyEdge(
-                                length=abs(child.i-token.i),
-                                parent_index=token.i-token_index_offset,
-                                child_index=child.i-token_index_offset
-                            )
+        # temporary list object for ③ `self.__edges`
+        this_sent_edges = list()
+
+        # temporary list object for ④ `self.__valid_token_indices`
+        this_sent_valid_token_indices = np.array([ True for _ in range(len(sent)) ])
+
+        # temporary list object for ⑤ `self.__subtree_indices`
+        this_sent_subtree_indices = [ None for _ in range(len(sent))]
+
+        # save ② raw token objects to post-process
+        is_special = [ self.__is_special_token(token) for token in sent ]
+        ## if every token is a special character, the first one carries the others
+        if all(is_special): is_special[0] = False
+        ## a run of consecutive special characters attaches as a whole to its nearest non-special token,
+        ## so that the text in-between is kept
+        for start, end in self.__get_special_runs(is_special):
+            if self.__attaches_right(sent, start, end, parsed):
+                # parent at right
+                this_sent_token_values_l[end] = sent[start]
+            else:
+                # parent at left
+                this_sent_token_values_r[start-1] = sent[end-1]
+            this_sent_valid_token_indices[start:end] = False # ④
+        for i, token in enumerate(sent):
+            if not is_special[i]: this_sent_token_values_m[i] = token
+
+        # enumerate through tokens inside a single sentence
+        for i, token in enumerate(sent):
+            # save token index of whole document
+            if i == 0: token_index_offset = token.i
+
+            if not parsed: continue
+
+            # save ③ dependency edge infos
+            for child in token.children:
+                # only if connected child is not a special character, inside this sentence.
+                if not self.__is_special_token(child) and sent.start <= child.i < sent.end:
+                    this_sent_edges.append(
+                        DependencyEdge(
+                            length=abs(child.i-token.i),
+                            parent_index=token.i-token_index_offset,
+                            child_index=child.i-token_index_offset
                         )
-                
-                # save ⑤ all children indices
-                this_token_subtree_indices = np.array([ False for _ in range(len(sent))])
-                for child in token.subtree:
-                    this_token_subtree_indices[child.i-token_index_offset] = True
-                this_sent_subtree_indices[i] = this_token_subtree_indices
+                    )
             
-            # post-process ② raw token objects into strings
-            this_sent_token_values = list()
-            for l, m, r in zip(
-                this_sent_token_values_l, 
-                this_sent_token_values_m, 
-                this_sent_token_values_r
-            ):
-                if m is not None:
-                    this_token_left_index = m.idx
-                    this_token_right_index = m.idx + len(str(m))
-                    
-                    if l is not None: this_token_left_index = l.idx
-                    if r is not None: this_token_right_index = r.idx + len(str(r))
-
-                    this_sent_token_values.append(str(doc)[this_token_left_index:this_token_right_index])
-                else:
-                    this_sent_token_values.append('')
-            self.__token_values.append(np.array(this_sent_token_values))
+            # save ⑤ all children indices
+            this_token_subtree_indices = np.array([ False for _ in range(len(sent))])
+            for child in token.subtree:
+                if sent.start <= child.i < sent.end:
+                    this_token_subtree_indices[child.i-token_index_offset] = True
+            this_sent_subtree_indices[i] = this_token_subtree_indices
+        
+        # post-process ② raw token objects into strings, and ⑦ their character offsets
+        this_sent_token_values = list()
+        this_sent_token_offsets = list()
+        for l, m, r, token in zip(
+            this_sent_token_values_l, 
+            this_sent_token_values_m, 
+            this_sent_token_values_r,
+            sent
+        ):
+            if m is not None:
+                this_token_left_index = m.idx
+                this_token_right_index = m.idx + len(str(m))
+                
+                if l is not None: this_token_left_index = l.idx
+                if r is not None: this_token_right_index = r.idx + len(str(r))
 
-            self.__edges.append(sorted(this_sent_edges))
-            self.__valid_token_indices.append(this_sent_valid_token_indices)
-            self.__subtree_indices.append(this_sent_subtree_indices)
-    
+                this_sent_token_values.append(sent.doc.text[this_token_left_index:this_token_right_index])
+            else:
+                this_token_left_index = token.idx
+                this_token_right_index = token.idx + len(str(token))
+                this_sent_token_values.append('')
+            this_sent_token_offsets.append((
+                this_token_left_index - sent.start_char,
+                this_token_right_index - sent.start_char,
+            ))
+        self.__token_values.append(np.array(this_sent_token_values))
+        self.__token_offsets.append(np.array(this_sent_token_offsets, dtype=int).reshape(-1, 2))
+
+        self.__edges.append(sorted(this_sent_edges))
+        self.__valid_token_indices.append(this_sent_valid_token_indices)
+        self.__subtree_indices.append(this_sent_subtree_indices)
+        self.__parsed.append(parsed)
+
+
+    def __get_special_runs(self, is_special:list):
+        """Finds the runs of consecutive special characters in a sentence.
+
+        is_special (List[bool]): Whether each token of the sentence is a special character.
+
+        RETURNS (List[Tuple[int, int]]): (start, end) token indices of each run.
+        """
+        runs = list()
+        start = None
+        for i, special in enumerate(is_special + [False]):
+            if special and start is None: start = i
+            elif not special and start is not None:
+                runs.append((start, i))
+                start = None
+        return runs
+
+    def __attaches_right(self, sent:Span, start:int, end:int, parsed:bool):
+        """Decides whether a run of special characters attaches to the token at its right or at its left.
+
+        sent (Span): A sentence from a spaCy document.
+        start (int): Index of the first special character of the run in the sentence.
+        end (int): Index after the last special character of the run in the sentence.
+        parsed (bool): Whether the sentence has a dependency parse.
+
+        RETURNS (bool): True if the run attaches to its right, False if to its left.
+        """
+        if start == 0: return True
+        if end == len(sent): return False
+
+        if parsed:
+            # the first head outside of the run, inside the sentence, is the direct parent
+            for token in sent[start:end]:
+                if sent.start <= token.head.i < sent.end and not sent.start + start <= token.head.i < sent.start + end:
+                    return token.head.i > token.i
+
+        # without dependency parse (or parent), the run attaches to the side it is written next to,
+        # and opening punctuations attach to their right
+        if not sent[start-1].whitespace_: return False
+        if not sent[end-1].whitespace_: return True
+        return sent[start].is_left_punct
+
+    def get_degraded_sentence_indices(self):
+        """Gets the indices of sentences which were split by punctuations and lengths only,
+        either because they were not parsed within the `time_budget` of `load_document()`,
+        or because the last `to_chunks*()` call ran out of its `time_budget`.
+
+        RETURNS (List[int]): Sorted list of sentence indices.
+        """
+        self.assert_doc_loaded()
+        unparsed_indices = [ i for i, parsed in enumerate(self.__parsed) if not parsed ]
+        return sorted(set(unparsed_indices + self.__degraded_indices))
+
+    def get_chunk_spans(self):
+        """Gets where each chunk returned by the last `to_chunks*()` call is in the loaded document.
+
+        A chunk may skip some tokens in-between, and its span covers them.
+
+        RETURNS (List[Tuple[int, int, int, int]]): (sentence index, chunk index in the sentence,
+            start character offset, end character offset) of each chunk.
+        """
+        self.assert_doc_loaded()
+        sentence_starts = self.__get_sentence_starts()
+        spans = list()
+        chunk_index = 0
+        for j, (sentence_index, first, last) in enumerate(self.__chunk_spans):
+            if j > 0 and self.__chunk_spans[j-1][0] == sentence_index: chunk_index += 1
+            else: chunk_index = 0
+            offsets = self.__token_offsets[sentence_index]
+            sentence_start = sentence_starts[sentence_index]
+            spans.append((
+                sentence_index,
+                chunk_index,
+                sentence_start + int(offsets[first][0]),
+                sentence_start + int(offsets[last][1]),
+            ))
+        return spans
 
     def to_sentences(self):
         """Converts the loaded document into a list of sentences.
@@ -177,11 +724,14 @@ class SplitEngine:
         return deepcopy(self.__sentences)
 
 
-    def to_chunks(self, num_chunk:int=None, len_chunk:int=None):
+    def to_chunks(self, num_chunk:int=None, len_chunk:int=None, balanced:bool=False, time_budget:float=None):
         """Converts the loaded document into chunks based on either number or length.
 
         num_chunk (int): Number of chunks to create.
         len_chunk (int): Maximum length of each chunk.
+        balanced (bool): If True, choose cuts that keep chunk lengths as even as possible.
+        time_budget (float): Time budget in seconds. Sentences left when the budget runs out
+            are split by punctuations and lengths only.
 
         RETURNS (List[str]): List of chunks.
         """
@@ -189,27 +739,44 @@ class SplitEngine:
         assert (num_chunk is not None) or (len_chunk is not None), \
             "Either `num_chunk` param or `len_chunk` param must be given."
         if len_chunk is None:
-            return self.to_chunks_by_num(num_chunk)
+            return self.to_chunks_by_num(num_chunk, balanced=balanced, time_budget=time_budget)
         if num_chunk is None:
-            return self.to_chunks_by_len(len_chunk)
+            return self.to_chunks_by_len(len_chunk, balanced=balanced, time_budget=time_budget)
 
-    def to_chunks_by_num(self, num_chunk:int):
+    def to_chunks_by_num(self, num_chunk:int, balanced:bool=False, time_budget:float=None):
         """Converts the loaded document into chunks based on the given number.
 
         num_chunk (int): Number of chunks to create.
+        balanced (bool): If True, cut each sentence into at most `num_chunk` chunks
+            while minimizing the length of the longest chunk.
+        time_budget (float): Time budget in seconds. Sentences left when the budget runs out
+            are split by lengths only.
 
         RETURNS (List[str]): List of chunks.
         """
         self.assert_doc_loaded()
         assert num_chunk > 0, "Valid `num_chunk` param must be given."
 
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        self.__degraded_indices = list()
+        self.__chunk_spans = list()
+        if balanced:
+            return self.__to_balanced_chunks(num_chunk=num_chunk, deadline=deadline)
+
         chunks = list()
-        for token_values, edges, valid_token_indices, subtree_indices in zip(
-            self.__token_values, self.__edges, self.__valid_token_indices, self.__subtree_indices
-        ):
+        for k, (token_values, edges, valid_token_indices, subtree_indices, parsed) in enumerate(zip(
+            self.__token_values, self.__edges, self.__valid_token_indices, self.__subtree_indices, self.__parsed
+        )):
+            # Fallback if the sentence is not parsed or the time is up.
+            if not parsed or (deadline is not None and time.perf_counter() > deadline):
+                if parsed: self.__degraded_indices.append(k)
+                for ids in self.__get_fallback_indices(token_values, num_chunk=num_chunk):
+                    self.__append_chunk(chunks, k, token_values, ids)
+                continue
+
             # Early stopping if there are fewer tokens than `num_chunk`.
             if len(token_values) <= num_chunk:
-                for t in token_values: chunks.append(t)
+                for i in range(len(token_values)): self.__append_chunk(chunks, k, token_values, [i])
                 continue
 
             this_sent_subtree_indices = [deepcopy(valid_token_indices)]  # sentence subtree indices memory
@@ -227,31 +794,53 @@ class SplitEngine:
                 condition = np.logical_and(np.logical_not(this_chunk_subtree_indices), condition)  # update condition on used parts of subtree
             indices = sorted(indices)  # final subtree indices
             for ids in indices:
-                chunks.append(self.__token_array_to_chunk(token_values[ids]))
+                self.__append_chunk(chunks, k, token_values, ids)
         
         return chunks
 
-    def to_chunks_by_len(self, len_chunk:int):
+    def to_chunks_by_len(self, len_chunk:int, balanced:bool=False, time_budget:float=None):
         """Converts the loaded document into chunks based on the given length.
 
         len_chunk (int): Maximum length of each chunk.
+        balanced (bool): If True, keep the fewest number of chunks that satisfies
+            `len_chunk`, but choose the cuts minimizing the length of the longest chunk.
+        time_budget (float): Time budget in seconds. Sentences left when the budget runs out
+            are split by punctuations and lengths only.
 
         RETURNS (List[str]): List of chunks.
         """
         self.assert_doc_loaded()
         assert len_chunk > 0, "Valid `len_chunk` param must be given."
 
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        self.__degraded_indices = list()
+        self.__chunk_spans = list()
+        if balanced:
+            return self.__to_balanced_chunks(len_chunk=len_chunk, deadline=deadline)
+
         chunks = list()
-        for token_values, edges, valid_token_indices, subtree_indices in zip(
-            self.__token_values, self.__edges, self.__valid_token_indices, self.__subtree_indices
-        ):
+        for k, (token_values, edges, valid_token_indices, subtree_indices, parsed) in enumerate(zip(
+            self.__token_values, self.__edges, self.__valid_token_indices, self.__subtree_indices, self.__parsed
+        )):
+            # Fallback if the sentence is not parsed or the time is up.
+            if not parsed or (deadline is not None and time.perf_counter() > deadline):
+                if parsed: self.__degraded_indices.append(k)
+                for ids in self.__get_fallback_indices(token_values, len_chunk=len_chunk):
+                    self.__append_chunk(chunks, k, token_values, ids)
+                continue
+
             # Early stopping if the sentence has already shorter length than `len_chunk`.
             if len(self.__token_array_to_chunk(token_values)) <= len_chunk:
-                chunks.append(self.__token_array_to_chunk(token_values))
+                self.__append_chunk(chunks, k, token_values, list(range(len(token_values))))
                 continue
 
             i = 0
+            ok = False  # a sentence without edges is split into tokens
+            timed_out = False
             while i < len(edges):
+                if deadline is not None and time.perf_counter() > deadline:
+                    timed_out = True
+                    break
                 ok = True
                 this_sent_subtree_indices = [deepcopy(valid_token_indices)]  # sentence subtree indices memory
                 for j in range(i+1):
@@ -274,20 +863,263 @@ class SplitEngine:
                 if not ok: i += 1; continue  # start over
                 else: break
             
-            if ok:
+            if timed_out:
+                self.__degraded_indices.append(k)
+                for ids in self.__get_fallback_indices(token_values, len_chunk=len_chunk):
+                    self.__append_chunk(chunks, k, token_values, ids)
+            elif ok:
                 indices = sorted(indices)  # final subtree indices
                 for ids in indices:
-                    t = self.__token_array_to_chunk(token_values[ids])
-                    if t:
-                        chunks.append(t)
+                    self.__append_chunk(chunks, k, token_values, ids, skip_empty=True)
             else:
                 # if failed to meet the conditions, even when whole edges were deleted,
-                for t in token_values:
-                    if t: chunks.append(t)
+                for i in range(len(token_values)):
+                    self.__append_chunk(chunks, k, token_values, [i], skip_empty=True)
         
         return chunks
 
-            
+
+    def chunk_documents(
+        self,
+        texts:Iterable[str],
+        num_chunk:int=None,
+        len_chunk:int=None,
+        balanced:bool=False,
+        batch_size:int=None,
+    ):
+        """Converts many documents into chunks, analyzing each distinct sentence only once.
+
+        Documents are pre-segmented at the punctuation characters of spaCy's rule-based
+        `Sentencizer`. Sentences repeated across the documents (e.g. templated notifications)
+        are parsed and chunked once, and the chunks are copied to every occurrence.
+        Since each sentence is parsed on its own, the results may slightly differ from
+        loading each document as a whole. The engine is left with the last distinct sentence loaded.
+
+        texts (Iterable[str]): non-splitted strings of documents.
+        num_chunk (int): Number of chunks to create.
+        len_chunk (int): Maximum length of each chunk.
+        balanced (bool): If True, choose cuts that keep chunk lengths as even as possible.
+        batch_size (int): `batch_size` parameter for `nlp.pipe()` function.
+
+        RETURNS (List[List[str]]): List of chunks of each document.
+        """
+        assert (num_chunk is None) != (len_chunk is None), \
+            "Either `num_chunk` param or `len_chunk` param must be given, not both."
+
+        # normalized sentence -> index of the distinct sentence
+        sentence_ids = dict()
+        documents = list()
+        for text in texts:
+            document = preprocess(text)
+            this_doc_ids = list()
+            if document:
+                for piece in self.__get_pieces(self.nlp_engine.make_doc(document)):
+                    this_doc_ids.append(sentence_ids.setdefault(piece.text, len(sentence_ids)))
+            documents.append(this_doc_ids)
+
+        sentence_chunks = list()
+        for _ in self.load_documents(sentence_ids, batch_size=batch_size):
+            sentence_chunks.append(self.to_chunks(num_chunk, len_chunk, balanced=balanced))
+
+        return [
+            [ chunk for i in this_doc_ids for chunk in sentence_chunks[i] ]
+            for this_doc_ids in documents
+        ]
+
+    def __to_balanced_chunks(self, num_chunk:int=None, len_chunk:int=None, deadline:float=None):
+        """Converts the loaded document into chunks of balanced lengths.
+
+        Each sentence is treated as a dependency tree whose nodes are weighted by
+        their chunk string length. For a given maximum weight, the fewest cuts are
+        found greedily from the leaves up, and the smallest maximum weight is then
+        found by binary search, so the whole search runs in O(n log n log L) per sentence.
+
+        num_chunk (int): Maximum number of chunks per sentence.
+        len_chunk (int): Maximum length of each chunk.
+        deadline (float): `time.perf_counter()` value after which sentences are split by lengths only.
+
+        RETURNS (List[str]): List of chunks.
+        """
+        chunks = list()
+        for k, (token_values, edges, valid_token_indices, subtree_indices, parsed) in enumerate(zip(
+            self.__token_values, self.__edges, self.__valid_token_indices, self.__subtree_indices, self.__parsed
+        )):
+            # Fallback if the sentence is not parsed or the time is up.
+            if not parsed or (deadline is not None and time.perf_counter() > deadline):
+                if parsed: self.__degraded_indices.append(k)
+                for ids in self.__get_fallback_indices(token_values, num_chunk=num_chunk, len_chunk=len_chunk):
+                    self.__append_chunk(chunks, k, token_values, ids)
+                continue
+
+            # Early stopping, same as in the unbalanced modes.
+            if num_chunk is not None and len(token_values) <= num_chunk:
+                for i in range(len(token_values)): self.__append_chunk(chunks, k, token_values, [i])
+                continue
+            if len_chunk is not None and len(self.__token_array_to_chunk(token_values)) <= len_chunk:
+                self.__append_chunk(chunks, k, token_values, list(range(len(token_values))))
+                continue
+
+            # each chunk is joined with single spaces, hence `len(value) + 1` per token
+            weights = np.array([ len(t) + 1 for t in token_values ]) * valid_token_indices
+            parents = self.__get_parent_indices(subtree_indices)
+            # every subtree is larger than the subtrees of its children, hence leaves first
+            order = list(np.argsort(np.array(subtree_indices).sum(axis=1), kind="stable"))
+            cuttable = np.array([ False for _ in range(len(token_values)) ])
+            for edge in edges: cuttable[edge.child_index] = True
+            # a sentence clipped to a window core may have several roots, of adjacent subtrees;
+            # each hangs from the root before it by a cuttable edge, so that it counts as a cut too
+            roots = np.where(parents < 0)[0]
+            order = [ i for i in order if parents[i] >= 0 ] + list(reversed(roots))
+            for previous_root, root in zip(roots, roots[1:]):
+                parents[root] = previous_root
+                cuttable[root] = True
+            children = [ list() for _ in range(len(parents)) ]
+            for i, p in enumerate(parents):
+                if p >= 0: children[p].append(i)
+
+            if len_chunk is not None:
+                max_cuts = self.__get_min_cuts(weights, children, order, cuttable, len_chunk + 1)
+                if max_cuts is None:
+                    # if failed to meet the conditions, even when whole edges were deleted,
+                    for i in range(len(token_values)):
+                        self.__append_chunk(chunks, k, token_values, [i], skip_empty=True)
+                    continue
+                hi = len_chunk + 1
+            else:
+                max_cuts = num_chunk - 1
+                hi = int(weights.sum())
+
+            # binary search for the smallest maximum weight within `max_cuts` cuts
+            lo = int(weights.max())
+            while lo < hi:
+                mid = (lo + hi) // 2
+                cuts = self.__get_min_cuts(weights, children, order, cuttable, mid)
+                if cuts is not None and cuts <= max_cuts: hi = mid
+                else: lo = mid + 1
+
+            cut_indices = list()
+            self.__get_min_cuts(weights, children, order, cuttable, hi, cut_indices)
+            for ids in self.__get_component_indices(parents, order, cut_indices, valid_token_indices):
+                self.__append_chunk(chunks, k, token_values, ids, skip_empty=True)
+
+        return chunks
+
+    def __get_fallback_indices(self, token_values:np.ndarray, num_chunk:int=None, len_chunk:int=None):
+        """Splits a sentence by punctuations and lengths only, without dependency edges.
+
+        token_values (np.ndarray): Token strings of a sentence, with special characters attached.
+        num_chunk (int): Number of chunks to create. Chunks are cut at even lengths.
+        len_chunk (int): Maximum length of each chunk. Chunks are cut after a punctuation
+            once half of `len_chunk` is filled, or where `len_chunk` would be exceeded.
+
+        RETURNS (List[List[int]]): Token indices of each chunk, in sentence order.
+        """
+        ids = [ i for i, t in enumerate(token_values) if t ]
+        if not ids: return list()
+
+        if len_chunk is None:
+            total = len(self.__token_array_to_chunk(token_values[ids]))
+            groups = [ list() for _ in range(num_chunk) ]
+            position = 0
+            for i in ids:
+                groups[min(position * num_chunk // total, num_chunk - 1)].append(i)
+                position += len(token_values[i]) + 1
+            return [ g for g in groups if g ]
+
+        groups = list()
+        current = list()
+        for i in ids:
+            if current and len(self.__token_array_to_chunk(token_values[current + [i]])) > len_chunk:
+                groups.append(current)
+                current = list()
+            current.append(i)
+            if unicodedata.category(token_values[i][-1]).startswith('P') \
+                and len(self.__token_array_to_chunk(token_values[current])) * 2 >= len_chunk:
+                groups.append(current)
+                current = list()
+        if current: groups.append(current)
+        return groups
+
+    def __append_chunk(self, chunks:list, sentence_index:int, token_values:np.ndarray, ids:list, skip_empty:bool=False):
+        """Appends a chunk made of the given tokens of a sentence, and records where it is.
+
+        chunks (List[str]): List of chunks to append to.
+        sentence_index (int): Index of the sentence.
+        token_values (np.ndarray): Token strings of the sentence, with special characters attached.
+        ids (List[int]): Sorted token indices of the chunk.
+        skip_empty (bool): If True, an empty chunk is not appended.
+        """
+        chunk = self.__token_array_to_chunk(token_values[ids])
+        if skip_empty and not chunk: return
+        chunks.append(chunk)
+        self.__chunk_spans.append((sentence_index, ids[0], ids[-1]))
+
+    def __get_parent_indices(self, subtree_indices):
+        """Recovers the parent index of each token from the subtree indices of a sentence.
+
+        subtree_indices (List[np.ndarray]): Subtree boolean masks of each token in a sentence.
+
+        RETURNS (np.ndarray): Parent index of each token, -1 for the root.
+        """
+        subtrees = np.array(subtree_indices)
+        n = len(subtrees)
+        # the parent is the smallest subtree which contains the token, other than its own.
+        sizes = np.where(subtrees, subtrees.sum(axis=1)[:, None], n + 1)
+        np.fill_diagonal(sizes, n + 1)
+        parents = sizes.argmin(axis=0)
+        parents[sizes.min(axis=0) > n] = -1
+        return parents
+
+    def __get_min_cuts(self, weights, children, order, cuttable, max_weight, cut_indices=None):
+        """Counts the fewest edge cuts so that no chunk exceeds the given weight.
+
+        Visits tokens from the leaves up; whenever a subtree gets too heavy,
+        its heaviest cuttable children are cut off first.
+
+        weights (np.ndarray): Weight of each token.
+        children (List[List[int]]): Child indices of each token.
+        order (List[int]): Token indices, leaves first.
+        cuttable (np.ndarray): Whether the edge to the parent of each token can be cut.
+        max_weight (int): Maximum weight of each chunk.
+        cut_indices (List[int]): If given, filled with the child index of each cut edge.
+
+        RETURNS (int): Number of cuts, or None if impossible.
+        """
+        residuals = np.zeros(len(weights), dtype=int)
+        num_cuts = 0
+        for i in order:
+            residual = weights[i] + sum(residuals[c] for c in children[i])
+            for c in sorted(children[i], key=lambda c: residuals[c], reverse=True):
+                if residual <= max_weight: break
+                if not cuttable[c] or residuals[c] == 0: continue
+                residual -= residuals[c]
+                num_cuts += 1
+                if cut_indices is not None: cut_indices.append(c)
+            if residual > max_weight: return None
+            residuals[i] = residual
+        return num_cuts
+
+    def __get_component_indices(self, parents, order, cut_indices, valid_token_indices):
+        """Groups the valid tokens of a sentence into chunks separated by the cut edges.
+
+        parents (np.ndarray): Parent index of each token, -1 for the root.
+        order (List[int]): Token indices, leaves first.
+        cut_indices (List[int]): Child index of each cut edge.
+        valid_token_indices (np.ndarray): Whether each token is not a special character.
+
+        RETURNS (List[List[int]]): Token indices of each chunk, in sentence order.
+        """
+        cut_indices = set(cut_indices)
+        labels = np.arange(len(parents))
+        for i in reversed(order):
+            if parents[i] >= 0 and i not in cut_indices:
+                labels[i] = labels[parents[i]]
+
+        components = dict()
+        for i in np.where(valid_token_indices)[0]:
+            components.setdefault(labels[i], list()).append(i)
+        return sorted(components.values())
+
     def __is_special_token(self, token: Token):
         """Check if a given spaCy token is a special character.
 
@@ -357,6 +1189,23 @@ class SplitEngine:
             f"'{size_code}' is not an available size code " \
             f"among the available size codes {available_size_codes} for '{lang_code}' language."
 
+    @classmethod
+    def normalize_codes(cls, lang_code, size_code):
+        """Normalizes language and size codes by resolving their aliases.
+
+        lang_code (str): Language code or its alias.
+        size_code (str): Model size code or its alias.
+
+        RETURNS (Tuple[str, str]): Normalized language code and size code.
+        """
+        lang_code = lang_code.lower()
+        if lang_code in _LANG_ALIASES: lang_code = _LANG_ALIASES[lang_code]
+
+        size_code = size_code.lower()
+        if size_code in _SIZE_ALIASES: size_code = _SIZE_ALIASES[size_code]
+
+        return lang_code, size_code
+
     @classmethod
     def get_available_lang_codes(cls):
         """Gets a list of available language codes.
@@ -0,0 +1,156 @@
+"""Bulk export of chunks with their positions, read and written in streaming fashion.
+
+Each row holds a chunk of a document and where it is:
+    doc_index, sentence_index, chunk_index, start_char, end_char, length, text
+"""
+from array import array
+import json
+from typing import Iterable
+
+import numpy as np
+
+from .engine import SplitEngine
+
+
+_NUMERIC_COLUMNS = ("doc_index", "sentence_index", "chunk_index", "start_char", "end_char", "length")
+
+
+def export_chunks(
+    engine: SplitEngine,
+    texts: Iterable[str],
+    path: str,
+    num_chunk: int = None,
+    len_chunk: int = None,
+    balanced: bool = False,
+    batch_size: int = None,
+    flush_size: int = 65536,
+):
+    """Splits many documents into chunks and writes them with their positions into a file.
+
+    Documents are read lazily from `texts`, a batch ahead of the one being split.
+    The format follows the file extension:
+        ".npz" - NumPy arrays, one per column. Texts are stored as concatenated UTF-8 bytes
+            ("text_data") with the offsets of each text ("text_offsets", one more than the rows).
+            An `.npz` file cannot be appended to, so every row is kept in memory until the end.
+        ".arrow" / ".feather" - Arrow IPC file, written batch by batch. Requires `pyarrow`.
+        ".jsonl" - one JSON object per line, written batch by batch.
+
+    engine (SplitEngine): A loaded engine.
+    texts (Iterable[str]): non-splitted strings of documents.
+    path (str): Path of the file to write.
+    num_chunk (int): Number of chunks to create.
+    len_chunk (int): Maximum length of each chunk.
+    balanced (bool): If True, choose cuts that keep chunk lengths as even as possible.
+    batch_size (int): `batch_size` parameter for `nlp.pipe()` function.
+    flush_size (int): Number of rows to buffer before writing.
+
+    RETURNS (int): Number of chunks written.
+    """
+    assert flush_size > 0, "Valid `flush_size` param must be given."
+    writer = _get_writer(str(path))
+
+    num_rows = 0
+    buffer = _new_buffer()
+    try:
+        for doc_index, document in enumerate(engine.load_documents(texts, batch_size=batch_size)):
+            if not document: continue  # nothing to split
+
+            chunks = engine.to_chunks(num_chunk, len_chunk, balanced=balanced)
+            for chunk, (sentence_index, chunk_index, start_char, end_char) in zip(chunks, engine.get_chunk_spans()):
+                buffer["doc_index"].append(doc_index)
+                buffer["sentence_index"].append(sentence_index)
+                buffer["chunk_index"].append(chunk_index)
+                buffer["start_char"].append(start_char)
+                buffer["end_char"].append(end_char)
+                buffer["length"].append(len(chunk))
+                buffer["text"].append(chunk)
+
+            if len(buffer["text"]) >= flush_size:
+                num_rows += len(buffer["text"])
+                writer.write(buffer)
+                buffer = _new_buffer()
+
+        num_rows += len(buffer["text"])
+        if buffer["text"]: writer.write(buffer)
+    finally:
+        writer.close()
+
+    return num_rows
+
+
+def _new_buffer():
+    """Creates empty columns, numeric ones as compact typed arrays."""
+    buffer = { name: array('q') for name in _NUMERIC_COLUMNS }
+    buffer["text"] = list()
+    return buffer
+
+
+def _get_writer(path: str):
+    """Gets the writer for the file extension of the given path."""
+    if path.endswith(".npz"): return _NpzWriter(path)
+    if path.endswith(".arrow") or path.endswith(".feather"): return _ArrowWriter(path)
+    if path.endswith(".jsonl"): return _JsonlWriter(path)
+    raise AssertionError(f"Unsupported file extension of '{path}'. Use '.npz', '.arrow', '.feather' or '.jsonl'.")
+
+
+class _JsonlWriter:
+    def __init__(self, path: str):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, buffer):
+        columns = _NUMERIC_COLUMNS + ("text",)
+        for row in zip(*(buffer[name] for name in columns)):
+            self.file.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+            self.file.write("\n")
+
+    def close(self):
+        self.file.close()
+
+
+class _NpzWriter:
+    """Accumulates columns as typed arrays and texts as a single byte buffer,
+    since an `.npz` file cannot be appended to."""
+    def __init__(self, path: str):
+        self.path = path
+        self.columns = { name: array('q') for name in _NUMERIC_COLUMNS }
+        self.text_data = bytearray()
+        self.text_offsets = array('q', [0])
+
+    def write(self, buffer):
+        for name in _NUMERIC_COLUMNS:
+            self.columns[name].extend(buffer[name])
+        for text in buffer["text"]:
+            self.text_data += text.encode("utf-8")
+            self.text_offsets.append(len(self.text_data))
+
+    def close(self):
+        np.savez(
+            self.path,
+            **{ name: np.frombuffer(column, dtype=np.int64) for name, column in self.columns.items() },
+            text_data=np.frombuffer(bytes(self.text_data), dtype=np.uint8),
+            text_offsets=np.frombuffer(self.text_offsets, dtype=np.int64),
+        )
+
+
+class _ArrowWriter:
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("`pyarrow` is required to export into Arrow files. Install it via `pip install pyarrow`.")
+        self.pa = pa
+        self.schema = pa.schema(
+            [ (name, pa.int64()) for name in _NUMERIC_COLUMNS ] + [ ("text", pa.string()) ]
+        )
+        self.writer = pa.ipc.new_file(path, self.schema)
+
+    def write(self, buffer):
+        pa = self.pa
+        self.writer.write_batch(pa.record_batch(
+            [ pa.array(np.frombuffer(buffer[name], dtype=np.int64)) for name in _NUMERIC_COLUMNS ]
+            + [ pa.array(buffer["text"], type=pa.string()) ],
+            schema=self.schema,
+        ))
+
+    def close(self):
+        self.writer.close()
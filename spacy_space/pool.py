@@ -0,0 +1,198 @@
+from collections import OrderedDict
+import gc
+from threading import Lock, RLock
+from typing import Any, Dict, Union
+
+from spacy.util import SimpleFrozenDict
+from thinc.api import Config
+
+from .engine import SplitEngine
+
+
+class SplitEnginePool:
+    def __init__(
+        self,
+        resource_size_code: str = "sm",
+        max_memory_mb: float = None,
+        max_engines: int = None,
+        config: Union[Dict[str, Any], Config] = SimpleFrozenDict(),
+        minimal: bool = False,
+    ):
+        """Holds `SplitEngine`s of many languages, loading them on demand.
+
+        When the estimated memory of the loaded engines exceeds `max_memory_mb`,
+        or their number exceeds `max_engines`, the least recently used engines are evicted.
+        The most recently requested engine is never evicted, even if it alone exceeds the budget.
+
+        resource_size_code (str): default model size code, used when no size code is given on request.
+        max_memory_mb (float): memory budget of the loaded engines in megabytes. If None, unbounded.
+        max_engines (int): maximum number of loaded engines. If None, unbounded.
+        config (Dict[str, Any] / Config): `config` parameter passed to every `SplitEngine`.
+        minimal (bool): `minimal` parameter passed to every `SplitEngine`.
+        """
+        assert max_memory_mb is None or max_memory_mb > 0, "Valid `max_memory_mb` param must be given."
+        assert max_engines is None or max_engines > 0, "Valid `max_engines` param must be given."
+
+        self.resource_size_code = resource_size_code
+        self.max_memory_mb = max_memory_mb
+        self.max_engines = max_engines
+        self.config = config
+        self.minimal = minimal
+
+        self.__engines = OrderedDict()  # (lang_code, size_code) -> SplitEngine, least recently used first
+        self.__memory_mb = dict()  # (lang_code, size_code) -> estimated memory in megabytes
+        self.__num_loads = 0
+        self.__num_evictions = 0
+        self.__lock = RLock()  # guards the bookkeeping above, never held while an engine loads
+        self.__loading_locks = dict()  # (lang_code, size_code) -> Lock held while its engine loads
+
+    def get_engine(self, resource_lang_code: str, resource_size_code: str = None):
+        """Gets the engine for the given language, loading it if not loaded yet.
+
+        resource_lang_code (str): language code or its alias.
+        resource_size_code (str): model size code or its alias. If None, the pool default is used.
+
+        RETURNS (SplitEngine): Engine for the given language and size.
+        """
+        if resource_size_code is None: resource_size_code = self.resource_size_code
+        key = SplitEngine.normalize_codes(resource_lang_code, resource_size_code)
+
+        with self.__lock:
+            engine = self.__get_loaded(key)
+            if engine is not None: return engine
+            loading_lock = self.__loading_locks.setdefault(key, Lock())
+
+        # concurrent requests for the same engine wait for a single load,
+        # while requests for other engines are not blocked by it
+        with loading_lock:
+            with self.__lock:
+                engine = self.__get_loaded(key)
+                if engine is not None: return engine
+
+            try:
+                engine = SplitEngine(*key, config=self.config, minimal=self.minimal)
+                memory_mb = estimate_memory_mb(engine)
+
+                with self.__lock:
+                    self.__engines[key] = engine
+                    self.__memory_mb[key] = memory_mb
+                    self.__num_loads += 1
+
+                    self.__evict_over_budget()
+                    return engine
+            finally:
+                # dropped once the engine is loaded, or failed to load so that a later request retries
+                with self.__lock:
+                    if self.__loading_locks.get(key) is loading_lock: del self.__loading_locks[key]
+
+    def __getitem__(self, resource_lang_code: str):
+        return self.get_engine(resource_lang_code)
+
+    def __contains__(self, resource_lang_code: str):
+        key = SplitEngine.normalize_codes(resource_lang_code, self.resource_size_code)
+        with self.__lock:
+            return key in self.__engines
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__engines)
+
+    def evict(self, resource_lang_code: str, resource_size_code: str = None):
+        """Evicts the engine for the given language, if loaded.
+
+        resource_lang_code (str): language code or its alias.
+        resource_size_code (str): model size code or its alias. If None, the pool default is used.
+
+        RETURNS (bool): True if an engine was evicted, False otherwise.
+        """
+        if resource_size_code is None: resource_size_code = self.resource_size_code
+        key = SplitEngine.normalize_codes(resource_lang_code, resource_size_code)
+
+        with self.__lock:
+            if key not in self.__engines: return False
+            self.__evict(key)
+            gc.collect()
+            return True
+
+    def get_stats(self):
+        """Reports the loaded engines and the load/evict counts of the pool.
+
+        RETURNS (Dict[str, Any]): Pool statistics.
+        """
+        with self.__lock:
+            return {
+                "loaded": [ f"{lang_code}_{size_code}" for lang_code, size_code in self.__engines ],
+                "memory_mb": sum(self.__memory_mb.values()),
+                "num_loads": self.__num_loads,
+                "num_evictions": self.__num_evictions,
+            }
+
+    def __get_loaded(self, key):
+        """Gets a loaded engine and marks it as the most recently used.
+
+        key (Tuple[str, str]): normalized language code and size code.
+
+        RETURNS (SplitEngine): The engine, or None if not loaded.
+        """
+        if key not in self.__engines: return None
+        self.__engines.move_to_end(key)
+        return self.__engines[key]
+
+    def __evict_over_budget(self):
+        """Evicts least recently used engines until the pool meets its budget."""
+        evicted = False
+        while len(self.__engines) > 1 and self.__is_over_budget():
+            self.__evict(next(iter(self.__engines)))
+            evicted = True
+        if evicted: gc.collect()
+
+    def __is_over_budget(self):
+        """Checks whether the loaded engines exceed the budget of the pool.
+
+        RETURNS (bool): True if over budget, False otherwise.
+        """
+        if self.max_engines is not None and len(self.__engines) > self.max_engines:
+            return True
+        if self.max_memory_mb is not None and sum(self.__memory_mb.values()) > self.max_memory_mb:
+            return True
+        return False
+
+    def __evict(self, key):
+        """Drops the reference to an engine.
+
+        key (Tuple[str, str]): normalized language code and size code.
+        """
+        del self.__engines[key]
+        del self.__memory_mb[key]
+        self.__num_evictions += 1
+
+
+def estimate_memory_mb(engine: SplitEngine):
+    """Estimates the memory held by the model weights and vectors of an engine.
+
+    Weights shared between components (e.g. a `tok2vec` with listeners) are counted once.
+    Weights held outside of thinc (e.g. PyTorch models of transformers) are not counted.
+
+    engine (SplitEngine): A loaded engine.
+
+    RETURNS (float): Estimated memory in megabytes.
+    """
+    nlp = engine.nlp_engine
+    num_bytes = 0
+
+    seen = set()
+    for _, proc in nlp.pipeline:
+        model = getattr(proc, "model", None)
+        if model is None or not hasattr(model, "walk"): continue
+        for node in model.walk():
+            if node.id in seen: continue
+            seen.add(node.id)
+            for name in node.param_names:
+                if node.has_param(name):
+                    num_bytes += node.get_param(name).nbytes
+
+    vectors = nlp.vocab.vectors
+    if vectors.data is not None:
+        num_bytes += vectors.data.nbytes
+
+    return num_bytes / (1024 * 1024)
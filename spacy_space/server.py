@@ -0,0 +1,229 @@
+"""Local HTTP service for sentence intra-splitting, with dynamic request micro-batching.
+
+Requests arriving within a short window are coalesced into one `nlp.pipe()` batch,
+so the parser sees batches without making a single request wait for long.
+
+run) python -m spacy_space.server --lang en --size sm --port 8000
+request) curl -X POST localhost:8000/split -d '{"text": "...", "len_chunk": 40}'
+"""
+import argparse
+import asyncio
+import json
+
+from .engine import SplitEngine
+
+
+class MicroBatcher:
+    def __init__(self, engine: SplitEngine, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """Coalesces concurrent split requests into batches for a single engine.
+
+        engine (SplitEngine): A loaded engine. Only the batching worker uses it, one batch at a time.
+        max_batch_size (int): Maximum number of requests in a single batch.
+        max_wait_ms (float): Maximum time to wait for more requests after the first one of a batch arrives.
+        """
+        assert max_batch_size > 0, "Valid `max_batch_size` param must be given."
+        assert max_wait_ms >= 0, "Valid `max_wait_ms` param must be given."
+
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self.num_requests = 0
+        self.num_batches = 0
+
+        self.__queue = None
+        self.__worker = None
+
+    async def start(self):
+        """Starts the batching worker on the running event loop."""
+        self.__queue = asyncio.Queue()
+        self.__worker = asyncio.create_task(self.__run())
+
+    async def stop(self):
+        """Stops the batching worker."""
+        if self.__worker is None: return
+        self.__worker.cancel()
+        try: await self.__worker
+        except asyncio.CancelledError: pass
+        self.__worker = None
+
+    async def submit(self, text: str, num_chunk: int = None, len_chunk: int = None, balanced: bool = False):
+        """Splits a document, batched together with other concurrent requests.
+
+        text (str): non-splitted string of a single document.
+        num_chunk (int): Number of chunks to create.
+        len_chunk (int): Maximum length of each chunk.
+        balanced (bool): If True, choose cuts that keep chunk lengths as even as possible.
+
+        RETURNS (List[str]): List of chunks, or list of sentences if neither `num_chunk` nor `len_chunk` is given.
+        """
+        assert self.__worker is not None, "Batching worker is not started. Please call `MicroBatcher.start()`."
+        future = asyncio.get_running_loop().create_future()
+        await self.__queue.put((text, num_chunk, len_chunk, balanced, future))
+        return await future
+
+    async def __run(self):
+        """Collects requests into batches and processes them outside of the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.__queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0: break
+                try: batch.append(await asyncio.wait_for(self.__queue.get(), timeout))
+                except asyncio.TimeoutError: break
+
+            try:
+                results = await loop.run_in_executor(None, self.process_batch, batch)
+            except Exception as e:
+                results = [ e for _ in batch ]
+
+            for (*_, future), result in zip(batch, results):
+                if future.done(): continue
+                if isinstance(result, Exception): future.set_exception(result)
+                else: future.set_result(result)
+
+    def process_batch(self, batch):
+        """Parses the documents of a batch at once, then splits each of them.
+
+        batch (List[Tuple]): (text, num_chunk, len_chunk, balanced, future) of each request.
+
+        RETURNS (List[Union[List[str], Exception]]): Result or error of each request.
+        """
+        self.num_requests += len(batch)
+        self.num_batches += 1
+
+        results = list()
+        texts = [ text for text, *_ in batch ]
+        for (_, num_chunk, len_chunk, balanced, _), document in zip(
+            batch, self.engine.load_documents(texts, batch_size=len(batch))
+        ):
+            try:
+                if not document:
+                    results.append(list())
+                elif num_chunk is None and len_chunk is None:
+                    results.append(self.engine.to_sentences())
+                else:
+                    results.append(self.engine.to_chunks(num_chunk, len_chunk, balanced=balanced))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class SplitServer:
+    def __init__(self, batcher: MicroBatcher, host: str = "127.0.0.1", port: int = 8000):
+        """Minimal HTTP/1.1 server in front of a `MicroBatcher`.
+
+        POST /split  {"text": str, "num_chunk": int, "len_chunk": int, "balanced": bool}
+            -> {"chunks": List[str]}, at most one of "num_chunk" and "len_chunk" given
+        GET /stats   -> {"num_requests": int, "num_batches": int}
+
+        batcher (MicroBatcher): Batcher to submit requests to.
+        host (str): Host to bind.
+        port (int): Port to bind.
+        """
+        self.batcher = batcher
+        self.host = host
+        self.port = port
+
+    async def serve_forever(self):
+        """Starts the batcher and serves requests until cancelled."""
+        await self.batcher.start()
+        server = await asyncio.start_server(self.__handle_connection, self.host, self.port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+    async def __handle_connection(self, reader, writer):
+        """Handles requests of a single (keep-alive) connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line: break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = dict()
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line: break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self.__route(method, path, body)
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive: break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __route(self, method, path, body):
+        """Dispatches a request to its handler.
+
+        RETURNS (Tuple[str, Dict]): HTTP status and JSON payload.
+        """
+        if method == "GET" and path == "/stats":
+            return "200 OK", {
+                "num_requests": self.batcher.num_requests,
+                "num_batches": self.batcher.num_batches,
+            }
+        if method != "POST" or path != "/split":
+            return "404 Not Found", {"error": f"No route for {method} {path}."}
+
+        try:
+            request = json.loads(body)
+            assert isinstance(request, dict), "Request must be a JSON object."
+            text = request["text"]
+            num_chunk, len_chunk = request.get("num_chunk"), request.get("len_chunk")
+            balanced = request.get("balanced", False)
+            assert isinstance(text, str), "Input must be a string."
+            assert num_chunk is None or len_chunk is None, \
+                "Either `num_chunk` param or `len_chunk` param must be given, not both."
+            for name, value in (("num_chunk", num_chunk), ("len_chunk", len_chunk)):
+                # JSON booleans are parsed as a subclass of int
+                assert value is None or (isinstance(value, int) and not isinstance(value, bool) and value > 0), \
+                    f"Valid `{name}` param must be given."
+            assert isinstance(balanced, bool), "Valid `balanced` param must be given."
+
+            chunks = await self.batcher.submit(text, num_chunk=num_chunk, len_chunk=len_chunk, balanced=balanced)
+        except (ValueError, KeyError, TypeError, AssertionError) as e:
+            return "400 Bad Request", {"error": str(e) or type(e).__name__}
+        except Exception as e:
+            return "500 Internal Server Error", {"error": str(e) or type(e).__name__}
+        return "200 OK", {"chunks": chunks}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="spacy_space local split service")
+    parser.add_argument("--lang", required=True, help="language code, refer to `SplitEngine.get_available_lang_codes()`")
+    parser.add_argument("--size", default="sm", help="model size code, refer to `SplitEngine.get_available_size_codes(lang_code)`")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    engine = SplitEngine(args.lang, args.size)
+    batcher = MicroBatcher(engine, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    server = SplitServer(batcher, host=args.host, port=args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+import spacy
+from spacy.attrs import DEP, HEAD
+from spacy.language import Language
+
+from spacy_space import SplitEngine
+
+
+@Language.component("chain_parser")
+def chain_parser(doc):
+    """Attaches each token to the previous one, starting a sentence after ".", "!" or "?".
+
+    Stands in for a trained parser, so that engines can be tested without downloading a model.
+    """
+    heads = np.zeros((len(doc), 2), dtype="uint64")
+    root, dep = doc.vocab.strings.add("ROOT"), doc.vocab.strings.add("dep")
+    sentence_start = True
+    for i, token in enumerate(doc):
+        # relative offsets of heads, as stored by spaCy
+        heads[i] = (0, root) if sentence_start else (np.uint64(-1 & 0xFFFFFFFFFFFFFFFF), dep)
+        sentence_start = token.text in (".", "!", "?")
+    doc.from_array([HEAD, DEP], heads)
+    return doc
+
+
+@Language.component("last_head_parser")
+def last_head_parser(doc):
+    """Attaches every token to the last token of the document, as a single sentence.
+
+    Spans which leave the last token out have as many roots as tokens.
+    """
+    heads = np.zeros((len(doc), 2), dtype="uint64")
+    root, dep = doc.vocab.strings.add("ROOT"), doc.vocab.strings.add("dep")
+    for i in range(len(doc)):
+        heads[i] = (len(doc) - 1 - i, dep if i + 1 < len(doc) else root)
+    doc.from_array([HEAD, DEP], heads)
+    return doc
+
+
+def _load_blank(*args, **kwargs):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("chain_parser", name="parser")
+    return nlp
+
+
+@pytest.fixture
+def make_engine(monkeypatch):
+    """Creates engines on a blank English pipeline with a stand-in parser, `chain_parser` by default."""
+    monkeypatch.setattr(spacy, "load", _load_blank)
+
+    def make_engine(parser="chain_parser", **kwargs):
+        engine = SplitEngine("en", "sm", **kwargs)
+        if parser != "chain_parser": engine.nlp_engine.replace_pipe("parser", parser)
+        return engine
+
+    return make_engine
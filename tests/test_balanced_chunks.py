@@ -0,0 +1,26 @@
+from collections import Counter
+
+
+TEXT = " ".join(f"word{i}" for i in range(30))
+
+
+def test_balanced_chunks_by_num_with_several_roots(make_engine):
+    # cores without the last token of their window have as many roots as tokens
+    engine = make_engine(parser="last_head_parser", max_sentence_tokens=8)
+    engine.load_document(TEXT)
+    assert len(engine.to_sentences()) > 1
+
+    for num_chunk in (1, 2, 3):
+        chunks = engine.to_chunks_by_num(num_chunk, balanced=True)
+        num_chunks_per_sentence = Counter(sentence_index for sentence_index, *_ in engine.get_chunk_spans())
+        assert max(num_chunks_per_sentence.values()) <= num_chunk
+        assert " ".join(chunks).split() == TEXT.split()
+
+
+def test_balanced_chunks_by_len_with_several_roots(make_engine):
+    engine = make_engine(parser="last_head_parser", max_sentence_tokens=8)
+    engine.load_document(TEXT)
+
+    chunks = engine.to_chunks_by_len(20, balanced=True)
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert " ".join(chunks).split() == TEXT.split()
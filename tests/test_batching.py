@@ -0,0 +1,30 @@
+import numpy as np
+
+from spacy_space.batching import plan_batches
+
+
+def get_batch_lengths(lengths, **kwargs):
+    batches, doc_indices, chunk_indices = plan_batches(lengths, **kwargs)
+    return [
+        sorted(lengths[doc_indices[i]][chunk_indices[i]] for i in batch)
+        for batch in batches
+    ]
+
+
+def test_plan_batches_gives_oversize_chunks_their_own_batch():
+    for padded in (True, False):
+        batches = get_batch_lengths([[0, 0, 20]], max_total_length=10, padded=padded)
+        assert sorted(batches) == [[0, 0], [20]]
+
+
+def test_plan_batches_meets_the_limits():
+    random_state = np.random.RandomState(0)
+    lengths = [ list(random_state.randint(0, 30, size=random_state.randint(0, 10))) for _ in range(50) ]
+    for padded in (True, False):
+        batches = get_batch_lengths(lengths, max_items=8, max_total_length=60, padded=padded)
+        assert sorted(length for batch in batches for length in batch) \
+            == sorted(length for this_doc_lengths in lengths for length in this_doc_lengths)
+        for batch in batches:
+            assert len(batch) <= 8
+            cost = max(batch) * len(batch) if padded else sum(batch)
+            assert cost <= 60 or len(batch) == 1
@@ -0,0 +1,37 @@
+import pytest
+
+
+TEXTS = [
+    "Your order has shipped. It will arrive tomorrow.",
+    "",
+    "Your order has shipped. Thank you for shopping with us today!",
+    "It will arrive tomorrow. Your order has shipped.",
+    "Your order has shipped.",
+]
+
+
+def test_chunk_documents_matches_load_document(make_engine):
+    engine, expected = make_engine(), make_engine()
+    for kwargs in (dict(len_chunk=12), dict(len_chunk=12, balanced=True), dict(num_chunk=2)):
+        results = engine.chunk_documents(TEXTS, batch_size=2, **kwargs)
+        assert len(results) == len(TEXTS)
+        for text, chunks in zip(TEXTS, results):
+            if not text:
+                assert chunks == []
+                continue
+            expected.load_document(text)
+            assert chunks == expected.to_chunks(**kwargs)
+
+
+def test_chunk_documents_parses_repeated_sentences_once(make_engine):
+    engine = make_engine()
+    engine.chunk_documents(TEXTS, len_chunk=12)
+    # three distinct sentences out of seven
+    assert engine.get_vocab_stats()["num_documents_since_reset"] == 3
+
+
+def test_chunk_documents_requires_either_num_chunk_or_len_chunk(make_engine):
+    engine = make_engine()
+    for kwargs in (dict(), dict(num_chunk=2, len_chunk=12)):
+        with pytest.raises(AssertionError):
+            engine.chunk_documents(TEXTS, **kwargs)
@@ -0,0 +1,27 @@
+import json
+
+from spacy_space.export import export_chunks
+
+
+TEXTS = [ f"Document number {i} is here. It has two sentences." for i in range(30) ]
+
+
+def test_export_chunks_reads_texts_incrementally(make_engine, tmp_path):
+    engine = make_engine()
+    num_loaded_on_read = list()
+
+    def read_texts():
+        for text in TEXTS:
+            num_loaded_on_read.append(engine.get_vocab_stats()["num_documents_since_reset"])
+            yield text
+
+    path = tmp_path / "chunks.jsonl"
+    num_rows = export_chunks(engine, read_texts(), path, len_chunk=10, batch_size=4, flush_size=8)
+
+    # each text is read while the documents a batch before it are being split
+    for i, num_loaded in enumerate(num_loaded_on_read):
+        assert num_loaded >= i - 4 - 1
+
+    rows = [ json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() ]
+    assert len(rows) == num_rows
+    assert { row["doc_index"] for row in rows } == set(range(len(TEXTS)))
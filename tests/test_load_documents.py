@@ -0,0 +1,27 @@
+TEXTS = [ f"Document number {i} is here. It has two sentences." for i in range(50) ]
+
+
+def test_load_documents_reads_texts_lazily(make_engine):
+    for kwargs in (dict(), dict(max_sentence_tokens=4)):
+        engine = make_engine(**kwargs)
+        num_read = 0
+
+        def read_texts():
+            nonlocal num_read
+            for text in TEXTS:
+                num_read += 1
+                yield text
+
+        for i, _ in enumerate(engine.load_documents(read_texts(), batch_size=4)):
+            # a batch of windows is read ahead at most
+            assert num_read <= i + 1 + 4
+
+
+def test_load_documents_matches_load_document(make_engine):
+    for kwargs in (dict(), dict(max_sentence_tokens=4)):
+        engine, expected = make_engine(**kwargs), make_engine(**kwargs)
+        for text, _ in zip(TEXTS, engine.load_documents(TEXTS, batch_size=4)):
+            expected.load_document(text)
+            assert engine.to_sentences() == expected.to_sentences()
+            assert engine.to_chunks_by_len(10) == expected.to_chunks_by_len(10)
+            assert engine.get_chunk_spans() == expected.get_chunk_spans()
@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import spacy
+
+from spacy_space import SplitEnginePool
+
+
+def test_get_engine_loads_once_without_blocking_loaded_engines(make_engine, monkeypatch):
+    load_blank = spacy.load
+    release = threading.Event()
+
+    def load_slowly(name, *args, **kwargs):
+        if name.startswith("de"): assert release.wait(timeout=10)
+        return load_blank(name, *args, **kwargs)
+
+    monkeypatch.setattr(spacy, "load", load_slowly)
+    pool = SplitEnginePool()
+    english = pool.get_engine("en")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [ executor.submit(pool.get_engine, "de") for _ in range(4) ]
+        # a loaded engine is served while another one loads
+        assert pool.get_engine("en") is english
+        assert "en" in pool and "de" not in pool
+        release.set()
+        germans = [ future.result(timeout=10) for future in futures ]
+
+    assert all(german is germans[0] for german in germans)
+    assert pool.get_stats()["num_loads"] == 2
@@ -0,0 +1,50 @@
+import asyncio
+import json
+import socket
+import urllib.error
+import urllib.request
+
+from spacy_space.server import MicroBatcher, SplitServer
+
+
+def post(port, payload):
+    request = urllib.request.Request(f"http://127.0.0.1:{port}/split", data=json.dumps(payload).encode("utf-8"))
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_split_server_validates_params(make_engine):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = SplitServer(MicroBatcher(make_engine(), max_wait_ms=0), port=port)
+    text = "The cat sat on the mat. The dog ran away."
+
+    async def run():
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        loop = asyncio.get_running_loop()
+        try:
+            return [
+                await loop.run_in_executor(None, post, port, payload)
+                for payload in (
+                    {"text": text, "len_chunk": 10},
+                    {"text": text, "num_chunk": 2, "len_chunk": 10},
+                    {"text": text, "num_chunk": "2"},
+                    {"text": text, "len_chunk": True},
+                    {"text": text, "num_chunk": 0},
+                    {"text": text, "num_chunk": 2, "balanced": "yes"},
+                    ["not", "an", "object"],
+                )
+            ]
+        finally:
+            task.cancel()
+
+    responses = asyncio.run(run())
+    status, payload = responses[0]
+    assert status == 200 and all(len(chunk) <= 10 for chunk in payload["chunks"])
+    for status, payload in responses[1:]:
+        assert status == 400 and payload["error"]
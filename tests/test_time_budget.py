@@ -0,0 +1,41 @@
+TEXTS = [
+    'He said "hello there".',
+    'Wait ("really") ok.',
+    '!',
+    'Hi... "Yes!" (she said). And then -- nothing [sic].',
+]
+
+
+def get_characters(text):
+    return "".join(text.split())
+
+
+def test_unparsed_sentences_keep_every_character(make_engine):
+    engine = make_engine()
+    for text in TEXTS:
+        engine.load_document(text, time_budget=0)
+        assert engine.get_degraded_sentence_indices() == list(range(len(engine.to_sentences())))
+
+        for chunks in (
+            engine.to_chunks_by_len(8),
+            engine.to_chunks_by_num(2),
+            engine.to_chunks_by_len(8, balanced=True),
+        ):
+            assert all(chunks)
+            assert get_characters("".join(chunks)) == get_characters(text)
+
+
+def test_parsed_sentences_keep_every_character(make_engine):
+    engine = make_engine()
+    for text in TEXTS:
+        engine.load_document(text)
+        assert engine.get_degraded_sentence_indices() == []
+        assert get_characters("".join(engine.to_chunks_by_len(8))) == get_characters(text)
+
+
+def test_chunks_after_time_budget_runs_out(make_engine):
+    engine = make_engine()
+    engine.load_document(" ".join(TEXTS))
+    chunks = engine.to_chunks_by_len(8, time_budget=0)
+    assert engine.get_degraded_sentence_indices() == list(range(len(engine.to_sentences())))
+    assert get_characters("".join(chunks)) == get_characters(" ".join(TEXTS))
@@ -0,0 +1,41 @@
+import random
+
+
+BASE_TEXT = "The cat sat on the mat. The dog ran away fast. Birds fly high! Fish swim deep in the sea."
+
+
+def get_outputs(engine):
+    return (
+        engine.to_sentences(),
+        engine.to_chunks_by_num(2),
+        engine.get_chunk_spans(),
+        engine.to_chunks_by_len(12, balanced=True),
+        engine.get_chunk_spans(),
+    )
+
+
+def assert_same_as_loaded(engine, expected, before, after):
+    engine.load_document(before)
+    engine.update_document(after)
+    expected.load_document(after)
+    assert get_outputs(engine) == get_outputs(expected)
+
+
+def test_update_document_moves_sentence_boundary(make_engine):
+    engine, expected = make_engine(), make_engine()
+    before = "The cat sat on the mat. The dog ran away fast. Birds fly high."
+    after = "The cat sat on the mat. The dog ran away fast Birds fly high."
+    assert_same_as_loaded(engine, expected, before, after)
+    assert_same_as_loaded(engine, expected, after, before)
+
+
+def test_update_document_random_edits(make_engine):
+    engine, expected = make_engine(), make_engine()
+    random_state = random.Random(0)
+    for _ in range(300):
+        after = list(BASE_TEXT)
+        for _ in range(random_state.randint(1, 3)):
+            position = random_state.randrange(len(after))
+            if random_state.random() < 0.5: del after[position]
+            else: after.insert(position, random_state.choice("ab .!"))
+        assert_same_as_loaded(engine, expected, BASE_TEXT, "".join(after))
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+
+TEXTS = [ f"Word{i} is new. Another{i} one." for i in range(20) ]
+
+
+def test_load_documents_parses_with_the_reset_vocab(make_engine):
+    num_original_strings = make_engine().get_vocab_stats()["num_original_strings"]
+    for kwargs in (dict(vocab_reset_interval=3), dict(max_vocab_strings=num_original_strings + 40)):
+        engine = make_engine(**kwargs)
+        for i, _ in enumerate(engine.load_documents(TEXTS, batch_size=8)):
+            # strings of the loaded document are interned in the vocab reported and reset
+            assert f"Word{i}" in engine.nlp_engine.vocab.strings
+            assert engine.to_sentences() == [f"Word{i} is new.", f"Another{i} one."]
+        assert engine.get_vocab_stats()["num_vocab_resets"] > 0
+
+
+def test_reset_vocab_keeps_shared_vectors(make_engine):
+    engine = make_engine()
+    vectors = engine.nlp_engine.vocab.vectors
+    strings = vectors.strings
+    engine.nlp_engine.vocab.set_vector("cat", np.ones(3, dtype="f"))
+
+    engine.reset_vocab()
+    assert vectors.strings is strings
+    assert engine.nlp_engine.vocab.vectors is not vectors
+    assert (engine.nlp_engine.vocab.get_vector("cat") == 1).all()
+
+
+def test_vocab_limits_are_validated(make_engine):
+    num_original_strings = make_engine().get_vocab_stats()["num_original_strings"]
+    for kwargs in (
+        dict(vocab_reset_interval=0),
+        dict(max_vocab_strings=num_original_strings),
+        dict(max_vocab_strings=10),
+    ):
+        with pytest.raises(AssertionError):
+            make_engine(**kwargs)